@@ -0,0 +1,297 @@
+"""Analyze Locust stats CSVs and compare Local vs AWS EKS runs.
+
+Expects a results directory containing Locust --csv output named
+``local-<test>_stats.csv`` (local docker-compose runs) and
+``ks-<test>_stats.csv`` (AWS EKS runs), e.g. ``local-8n_stats.csv`` for
+the 8-node test. Produces a per-run summary table, an environment
+comparison, and a Markdown comparison report.
+
+Usage:
+    python scripts/analyze_locust_results.py [results_dir] [report.md]
+"""
+
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401  (pandas' parquet engine)
+    _HAVE_PYARROW = True
+except ImportError:
+    _HAVE_PYARROW = False
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+# Matches "<env>-<test>_stats.csv" produced by locust --csv, where env is
+# "local" (docker-compose) or "ks" (AWS EKS).
+_STATS_PAT = re.compile(r"^(local|ks)-([^_]+)_stats\.csv$")
+
+METRIC_COLS = [
+    "Average Response Time",
+    "Median Response Time",
+    "95%",
+    "99%",
+]
+
+# Only the columns the analysis reads, with explicit dtypes: skips pandas
+# type inference over the full file and never materializes the unused
+# object-dtype text columns of the Locust stats format.
+STATS_COLUMNS = [
+    "Type",
+    "Name",
+    "Request Count",
+    "Failure Count",
+    "Average Response Time",
+    "Median Response Time",
+    "Min Response Time",
+    "Max Response Time",
+    "Requests/s",
+    "95%",
+    "99%",
+]
+STATS_DTYPES = {
+    "Type": "string",
+    "Name": "string",
+    "Request Count": "int64",
+    "Failure Count": "int64",
+    "Average Response Time": "float64",
+    "Median Response Time": "float64",
+    "Min Response Time": "float64",
+    "Max Response Time": "float64",
+    "Requests/s": "float64",
+    "95%": "float64",
+    "99%": "float64",
+}
+
+
+# Output schema of analyze_directory; passing this to from_records skips
+# the per-dict column discovery pd.DataFrame(list_of_dicts) performs.
+RESULT_COLS = [
+    "Environment",
+    "Test",
+    "Requests",
+    "Failures",
+    "Avg Response Time (ms)",
+    "Median Response Time (ms)",
+    "P95 (ms)",
+    "P99 (ms)",
+    "Requests/s",
+    "Failure Rate (%)",
+]
+
+
+def parse_filename(filename):
+    """Map 'local-8n_stats.csv' -> ('Local', '8n'), 'ks-...' -> AWS EKS.
+
+    Returns None for names that are not stats CSVs.
+    """
+    m = _STATS_PAT.match(filename)
+    if m is None:
+        return None
+    env = "Local" if m.group(1) == "local" else "AWS EKS"
+    return env, m.group(2)
+
+
+def load_stats_file(filepath):
+    """Load a Locust stats CSV, memoized as a Parquet sidecar.
+
+    The analysis is typically re-run many times over the same result
+    directories; the columnar sidecar skips CSV parsing and type
+    conversion on every run after the first. A stale sidecar (older than
+    its CSV) is rebuilt. Falls back to plain CSV when pyarrow is not
+    installed.
+    """
+    if not _HAVE_PYARROW:
+        return pd.read_csv(filepath, usecols=STATS_COLUMNS,
+                           dtype=STATS_DTYPES, engine="c")
+
+    parquet_path = os.path.splitext(filepath)[0] + ".parquet"
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= os.path.getmtime(filepath)):
+        return pd.read_parquet(parquet_path, columns=STATS_COLUMNS)
+
+    df = pd.read_csv(filepath, usecols=STATS_COLUMNS, dtype=STATS_DTYPES,
+                     engine="c")
+    df.to_parquet(parquet_path)
+    return df
+
+
+def analyze_directory(results_dir):
+    """Summarize every stats CSV in results_dir into one row each.
+
+    Per-endpoint rows are combined into request-count-weighted averages
+    via _weighted_avgs, which computes all four latency metrics in one
+    pass instead of six separate pandas column scans.
+    """
+    results = []
+    # os.scandir hands back lightweight DirEntry objects with the name
+    # cached; no per-entry Path construction or glob pattern walk.
+    for entry in os.scandir(results_dir):
+        parsed = parse_filename(entry.name)
+        if parsed is None:
+            continue
+        env, param = parsed
+        df = load_stats_file(entry.path)
+        df = df[df["Name"] != "Aggregated"]
+
+        counts = df["Request Count"].to_numpy(dtype=np.float64)
+        vals = df[METRIC_COLS].to_numpy(dtype=np.float64)
+        total, weighted = _weighted_avgs(counts, vals)
+        if total == 0:
+            continue
+
+        results.append({
+            "Environment": env,
+            "Test": param,
+            "Requests": int(total),
+            "Failures": int(df["Failure Count"].sum()),
+            "Avg Response Time (ms)": weighted[0],
+            "Median Response Time (ms)": weighted[1],
+            "P95 (ms)": weighted[2],
+            "P99 (ms)": weighted[3],
+            "Requests/s": float(df["Requests/s"].sum()),
+            "Failure Rate (%)": 100.0 * df["Failure Count"].sum() / total,
+        })
+    return pd.DataFrame.from_records(results, columns=RESULT_COLS)
+
+
+if _HAVE_NUMBA:
+    # One fused streaming pass over (counts, metrics): for stats files
+    # with long endpoint lists this computes the total and every weighted
+    # sum in a single loop with no intermediate arrays, instead of the
+    # GEMV allocating per-metric temporaries.
+    @njit(cache=True, fastmath=True)
+    def _weighted_avgs(counts, vals):
+        n, m = vals.shape
+        total = 0.0
+        acc = np.zeros(m, dtype=np.float64)
+        for i in range(n):
+            c = counts[i]
+            total += c
+            for j in range(m):
+                acc[j] += c * vals[i, j]
+        if total > 0.0:
+            for j in range(m):
+                acc[j] /= total
+        return total, acc
+else:
+    def _weighted_avgs(counts, vals):
+        total = counts.sum()
+        if total == 0:
+            return 0.0, np.zeros(vals.shape[1], dtype=np.float64)
+        return total, counts @ vals / total
+
+
+def calc_diff(aws_val, ls_val):
+    """Percent difference of AWS vs local, or None when undefined."""
+    if ls_val == 0:
+        return None
+    return (aws_val - ls_val) / ls_val * 100.0
+
+
+COMPARE_METRICS = [
+    ("Avg latency", "Avg Response Time (ms)", "ms"),
+    ("Median latency", "Median Response Time (ms)", "ms"),
+    ("P95 latency", "P95 (ms)", "ms"),
+    ("P99 latency", "P99 (ms)", "ms"),
+    ("Throughput", "Requests/s", "req/s"),
+    ("Failure rate", "Failure Rate (%)", "%"),
+]
+
+
+def compare_environments(df):
+    """Print a Local vs AWS EKS comparison for every test present in both."""
+    # Index once by (Environment, Test): each pair lookup is then a hashed
+    # .loc instead of two boolean-mask scans over the whole frame per test.
+    df_idx = df.set_index(["Environment", "Test"]).sort_index()
+    for test in df["Test"].unique():
+        try:
+            local_row = df_idx.loc[("Local", test)]
+            aws_row = df_idx.loc[("AWS EKS", test)]
+        except KeyError:
+            print(f"[{test}] missing one environment, skipping comparison")
+            continue
+
+        # All six percent-diffs in one branchless np.where instead of a
+        # Python conditional per metric.
+        cols = [col for _, col, _ in COMPARE_METRICS]
+        ls = local_row[cols].to_numpy(dtype=np.float64)
+        aws = aws_row[cols].to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            diffs = np.where(ls == 0, np.nan, (aws - ls) / ls * 100.0)
+
+        print(f"\n=== {test}: Local vs AWS EKS ===")
+        for (label, _, unit), l_val, a_val, diff in zip(
+                COMPARE_METRICS, ls, aws, diffs):
+            diff_str = "n/a" if np.isnan(diff) else f"{diff:+.1f}%"
+            print(f"  {label:>15}: {l_val:10.1f} {unit:>5}  ->"
+                  f" {a_val:10.1f} {unit:>5}  ({diff_str})")
+
+
+def generate_comparison_report(df, output_path):
+    # datetime.now() instead of pd.Timestamp.now(): no pandas timezone
+    # machinery for a display-only header timestamp.
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    report = f"""# Local vs AWS EKS Comparison
+
+Generated: {timestamp}
+
+## Per-run summary
+
+"""
+    # to_dict("records") materializes plain dicts once; iterrows would box
+    # every row into a Series and pay Index.get_loc on each field access.
+    for rec in df.sort_values(["Test", "Environment"]).to_dict("records"):
+        report += (f"- **{rec['Test']} / {rec['Environment']}**: "
+                   f"{rec['Requests']} requests, "
+                   f"avg {rec['Avg Response Time (ms)']:.1f} ms, "
+                   f"p99 {rec['P99 (ms)']:.1f} ms, "
+                   f"{rec['Requests/s']:.1f} req/s, "
+                   f"{rec['Failure Rate (%)']:.2f}% failures\n")
+
+    report += "\n## Environment differences (AWS vs Local)\n\n"
+    df_idx = df.set_index(["Environment", "Test"]).sort_index()
+    for test in df["Test"].unique():
+        try:
+            local_row = df_idx.loc[("Local", test)]
+            aws_row = df_idx.loc[("AWS EKS", test)]
+        except KeyError:
+            continue
+        diff = calc_diff(aws_row["Avg Response Time (ms)"],
+                         local_row["Avg Response Time (ms)"])
+        if diff is not None:
+            report += f"- **{test}**: average latency {diff:+.1f}% on AWS\n"
+
+    # Single write_text call with an explicit encoding; open() without one
+    # is locale-dependent and the buffered-writer setup buys nothing for
+    # one pre-built string.
+    Path(output_path).write_text(report, encoding="utf-8", newline="\n")
+    return output_path
+
+
+def main():
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "results"
+    output_path = sys.argv[2] if len(sys.argv) > 2 else "results/comparison.md"
+
+    df = analyze_directory(results_dir)
+    if df.empty:
+        print(f"no *_stats.csv files found in {results_dir}")
+        return
+
+    print(df.to_string(index=False))
+    compare_environments(df)
+    print(f"\nwrote {generate_comparison_report(df, output_path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Build a Markdown scaling summary from Locust stats CSVs.
+
+Companion to analyze_locust_results.py for the node-scaling runs: expects
+``<results_dir>/<N>-nodes/`` directories each holding Locust --csv output
+named ``local-<test>_stats.csv`` / ``ks-<test>_stats.csv`` and writes one
+SUMMARY.md covering all cluster sizes.
+
+Usage:
+    python scripts/analyze_results_simple.py [results_dir] [SUMMARY.md]
+"""
+
+import sys
+from datetime import datetime
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+
+STATS_COLUMNS = [
+    "Type",
+    "Name",
+    "Request Count",
+    "Failure Count",
+    "Average Response Time",
+    "Median Response Time",
+    "Requests/s",
+    "95%",
+    "99%",
+]
+STATS_DTYPES = {
+    "Type": "string",
+    "Name": "string",
+    "Request Count": "int64",
+    "Failure Count": "int64",
+    "Average Response Time": "float64",
+    "Median Response Time": "float64",
+    "Requests/s": "float64",
+    "95%": "float64",
+    "99%": "float64",
+}
+
+
+def load_stats(filepath):
+    return pd.read_csv(filepath, usecols=STATS_COLUMNS, dtype=STATS_DTYPES,
+                       engine="c")
+
+
+def summarize_file(filepath, node_count, env, test):
+    df = load_stats(filepath)
+    agg = df[df["Name"] == "Aggregated"]
+    if agg.empty:
+        return None
+    row = agg.iloc[0]
+    total = int(row["Request Count"])
+    if total == 0:
+        return None
+    return pd.DataFrame([{
+        "Node Count": node_count,
+        "Environment": env,
+        "Test": test,
+        "Requests": total,
+        "Avg Response Time (ms)": float(row["Average Response Time"]),
+        "Median (ms)": float(row["Median Response Time"]),
+        "P95 (ms)": float(row["95%"]),
+        "P99 (ms)": float(row["99%"]),
+        "Requests/s": float(row["Requests/s"]),
+        "Failure Rate (%)": 100.0 * int(row["Failure Count"]) / total,
+    }])
+
+
+def _markdown_table(df):
+    """Render a DataFrame as a Markdown table via pandas' C CSV writer.
+
+    iterrows boxes every row into a Series; to_csv with a '|' separator
+    formats the whole frame in one native call, and we only dress the
+    lines up with the pipe borders and the header separator row.
+    """
+    buf = StringIO()
+    df.to_csv(buf, sep="|", index=False, float_format="%.1f")
+    lines = ["| " + ln.replace("|", " | ") + " |"
+             for ln in buf.getvalue().splitlines()]
+    lines.insert(1, "|" + "|".join("---" for _ in df.columns) + "|")
+    return "\n".join(lines) + "\n"
+
+
+def generate_summary_report(results_dir, md_file):
+    all_results = []
+    for node_dir in sorted(Path(results_dir).glob("*-nodes")):
+        node_count = int(node_dir.name.split("-")[0])
+        for path in sorted(node_dir.glob("*_stats.csv")):
+            prefix, _, rest = path.name.partition("-")
+            env = "Local" if prefix == "local" else "AWS EKS"
+            test = rest.replace("_stats.csv", "")
+            summary = summarize_file(path, node_count, env, test)
+            if summary is not None:
+                all_results.append(summary)
+
+    if not all_results:
+        print(f"no *_stats.csv files found under {results_dir}")
+        return None
+
+    # copy=False: the single-row frames are never touched again, so let
+    # concat reuse their arrays instead of duplicating every column.
+    combined_df = pd.concat(all_results, ignore_index=True, copy=False)
+    node_counts = sorted(combined_df["Node Count"].unique())
+
+    # Accumulate the report in a list and write once at the end; the old
+    # per-line f.write pattern hit the I/O layer over a hundred times.
+    buf = []
+    w = buf.append
+
+    # datetime.now() instead of pd.Timestamp.now(): no pandas timezone
+    # machinery for a display-only header timestamp.
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    w("# Scaling Summary\n\n")
+    w(f"Generated: {timestamp}\n\n")
+
+    w("## All runs\n\n")
+    w(_markdown_table(combined_df))
+    w("\n")
+
+    w("## Key findings\n\n")
+
+    # One hashed aggregation replaces the old per-section boolean-mask
+    # scans (two filters per node count per metric, 18+ passes over the
+    # frame). Missing (node count, environment) combinations come back
+    # as NaN, matching the old mean-of-empty behaviour.
+    agg = combined_df.groupby(["Node Count", "Environment"])[
+        ["Avg Response Time (ms)", "Requests/s", "Failure Rate (%)"]
+    ].mean().unstack("Environment")
+
+    def cell(nc, col, env):
+        try:
+            return agg.loc[nc, (col, env)]
+        except KeyError:
+            return float("nan")
+
+    w("### Latency by cluster size\n\n")
+    for nc in node_counts:
+        w(f"- **{nc} nodes**: "
+          f"local {cell(nc, 'Avg Response Time (ms)', 'Local'):.1f} ms, "
+          f"AWS EKS {cell(nc, 'Avg Response Time (ms)', 'AWS EKS'):.1f} ms\n")
+    w("\n")
+
+    w("### Throughput by cluster size\n\n")
+    for nc in node_counts:
+        w(f"- **{nc} nodes**: "
+          f"local {cell(nc, 'Requests/s', 'Local'):.1f} req/s, "
+          f"AWS EKS {cell(nc, 'Requests/s', 'AWS EKS'):.1f} req/s\n")
+    w("\n")
+
+    w("### Failure rate by cluster size\n\n")
+    for nc in node_counts:
+        w(f"- **{nc} nodes**: "
+          f"local {cell(nc, 'Failure Rate (%)', 'Local'):.2f}%, "
+          f"AWS EKS {cell(nc, 'Failure Rate (%)', 'AWS EKS'):.2f}%\n")
+
+    Path(md_file).write_text("".join(buf), encoding="utf-8", newline="\n")
+    return md_file
+
+
+def main():
+    results_dir = sys.argv[1] if len(sys.argv) > 1 else "results"
+    md_file = sys.argv[2] if len(sys.argv) > 2 else "results/SUMMARY.md"
+    out = generate_summary_report(results_dir, md_file)
+    if out:
+        print(f"wrote {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Generate the benchmark charts and Markdown report under results/.
+
+Renders the three experiments documented in the README (latency scaling,
+hit rate under churn, throughput under load) from the aggregated run data
+below. Uses a single reusable Agg Figure instead of pyplot: the pyplot
+state machine re-creates figure/axes/font machinery per chart, which
+dominates runtime in batch-export scripts like this one.
+
+Usage:
+    python scripts/generate-report.py [output_dir]
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Keep the font cache in a persistent location so repeat/CI runs skip the
+# system font-directory scan, the single largest matplotlib startup cost.
+# Must be set before matplotlib is imported.
+os.environ.setdefault("MPLCONFIGDIR", "/tmp/mpl")
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+from matplotlib import rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# ------------------------------------------------------------------
+# Aggregated run data (see README "Benchmark Report" for sources)
+# ------------------------------------------------------------------
+
+NODE_COUNTS = [8, 16, 32]
+
+# Average /cache latency (ms) by cluster size.
+AVG_LATENCY = {
+    "Chord": [18.8, 18.8, 19.4],
+    "Koorde (k=2)": [25.5, 37.4, 54.9],
+    "Koorde (k=8)": [24.8, 48.1, 50.3],
+}
+
+# Latency distribution at 32 nodes (ms).
+LATENCY = {
+    "Simple Hash": {"p50": 18, "avg": 18.9, "p95": 28, "p99": 45},
+    "Chord": {"p50": 19, "avg": 19.7, "p95": 25, "p99": 37},
+    "Koorde": {"p50": 46, "avg": 60.5, "p95": 140, "p99": 190},
+}
+
+# Hit rate (%) per churn phase (4 -> 3 -> 4 nodes).
+HIT_RATES = {
+    "Simple Hash": [19.7, 16.3, 21.0],
+    "Chord": [33.3, 46.7, 34.7],
+    "Koorde": [31.7, 41.3, 33.0],
+}
+
+# Throughput sweep: sustained RPS and failure rate (%) by user count.
+USER_COUNTS = [50, 100, 200, 500, 1000, 2000, 4000]
+THROUGHPUT = {
+    "Chord": [850, 1450, 2200, 2750, 2950, 3050, 3000],
+    "Koorde": [800, 1300, 1900, 2150, 2200, 2150, 1800],
+}
+FAILURE_RATES = {
+    "Chord": [0.0, 0.0, 0.0, 0.1, 0.2, 0.5, 0.8],
+    "Koorde": [0.0, 0.0, 0.1, 0.3, 0.8, 2.1, 5.4],
+}
+
+PROTOCOL_COLORS = {
+    "Simple Hash": "#999999",
+    "Chord": "#1f77b4",
+    "Koorde": "#ff7f0e",
+    "Koorde (k=2)": "#ff7f0e",
+    "Koorde (k=8)": "#d62728",
+}
+
+_FIG = None
+_CANVAS = None
+
+
+def setup_style():
+    # Name the bundled DejaVu faces explicitly under the generic families
+    # so findfont never falls back to scanning system font directories.
+    rcParams["font.family"] = "sans-serif"
+    rcParams["font.sans-serif"] = ["DejaVu Sans"]
+    rcParams["font.serif"] = ["DejaVu Serif"]
+    # 100 DPI is plenty for Markdown-embedded charts and renders ~2.25x
+    # fewer pixels than the old 150.
+    rcParams["figure.dpi"] = 100
+    rcParams["axes.grid"] = True
+    rcParams["grid.alpha"] = 0.3
+    rcParams["axes.spines.top"] = False
+    rcParams["axes.spines.right"] = False
+
+
+def _fig():
+    """Return the process-wide reusable Figure, creating it on first use.
+
+    Callers must fig.clf() before drawing. Sharing one Figure amortizes the
+    expensive Axes/Text/Font construction across all charts rendered by
+    this process.
+    """
+    global _FIG, _CANVAS
+    if _FIG is None:
+        _FIG = Figure(figsize=(12, 7))
+        _CANVAS = FigureCanvasAgg(_FIG)
+    return _FIG
+
+
+def _save(fig, filepath):
+    # compress_level=1 trades a slightly larger PNG for much faster zlib
+    # encoding than PIL's default level 6.
+    fig.savefig(filepath, dpi=100, bbox_inches="tight",
+                pil_kwargs={"compress_level": 1})
+    return filepath
+
+
+def create_latency_chart(output_dir):
+    fig = _fig()
+    fig.clf()
+    ax1 = fig.add_subplot(1, 2, 1)
+    ax2 = fig.add_subplot(1, 2, 2)
+
+    for name, values in AVG_LATENCY.items():
+        ax1.plot(NODE_COUNTS, values, marker="o", label=name,
+                 color=PROTOCOL_COLORS[name])
+    ax1.set_xlabel("Cluster size (nodes)")
+    ax1.set_ylabel("Avg /cache latency (ms)")
+    ax1.set_title("Latency vs cluster size")
+    ax1.set_xticks(NODE_COUNTS)
+    ax1.legend()
+
+    protocols = ["Chord", "Koorde"]
+    p99s = [LATENCY[p]["p99"] for p in protocols]
+    bars = ax2.bar(protocols, p99s,
+                   color=[PROTOCOL_COLORS[p] for p in protocols])
+    ax2.bar_label(bars, labels=[f"{v} ms" for v in p99s], fontsize=10,
+                  fontweight="bold", padding=2)
+    ax2.set_ylabel("P99 latency (ms)")
+    ax2.set_title("Tail latency at 32 nodes")
+
+    fig.suptitle("Experiment 1: Latency Scaling (Chord vs Koorde)")
+    return _save(fig, os.path.join(output_dir, "latency_vs_nodes.png"))
+
+
+def create_hit_rate_chart(output_dir):
+    fig = _fig()
+    fig.clf()
+    ax = fig.add_subplot(1, 1, 1)
+
+    phases = ["Phase 1 (4 nodes)", "Phase 2 (3 nodes)", "Phase 3 (4 nodes)"]
+    x = np.arange(len(phases))
+    width = 0.25
+
+    for offset, (name, values) in enumerate(HIT_RATES.items()):
+        bars = ax.bar(x + (offset - 1) * width, values, width, label=name,
+                      color=PROTOCOL_COLORS[name])
+        ax.bar_label(bars, labels=[f"{v:.1f}%" for v in values], fontsize=9,
+                     fontweight="bold", padding=2)
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(phases)
+    ax.set_ylabel("Cache hit rate (%)")
+    ax.set_title("Experiment 2: Hit Rate Under 3-Phase Node Churn")
+    ax.legend()
+    return _save(fig, os.path.join(output_dir, "hit_rate_comparison.png"))
+
+
+def create_failures_chart(output_dir):
+    fig = _fig()
+    fig.clf()
+    ax = fig.add_subplot(1, 1, 1)
+
+    x = np.arange(len(USER_COUNTS))
+    width = 0.35
+    for offset, (name, values) in enumerate(FAILURE_RATES.items()):
+        bars = ax.bar(x + (offset - 0.5) * width, values, width, label=name,
+                      color=PROTOCOL_COLORS[name])
+        ax.bar_label(bars, labels=[f"{v:.1f}%" for v in values], fontsize=8,
+                     padding=2)
+
+    ax.set_xticks(x)
+    ax.set_xticklabels([str(u) for u in USER_COUNTS])
+    ax.set_xlabel("Concurrent users")
+    ax.set_ylabel("Failure rate (%)")
+    ax.set_title("Experiment 3: Failure Rate Under Load")
+    ax.legend()
+    return _save(fig, os.path.join(output_dir, "failure_rate.png"))
+
+
+def create_summary_chart(output_dir):
+    fig = _fig()
+    fig.clf()
+    ax = fig.add_subplot(1, 1, 1)
+
+    protocols = list(HIT_RATES.keys())
+    hr = np.array([HIT_RATES[p] for p in protocols]).mean(axis=1)
+    p99 = np.array([LATENCY[p]["p99"] for p in protocols], dtype=np.float64)
+    ls = np.clip(100.0 - p99, 0.0, None)
+
+    # Composite score: 60% hit rate, 40% latency headroom.
+    scores = 0.6 * hr + 0.4 * ls
+    order = np.argsort(scores)
+
+    names = [protocols[i] for i in order]
+    values = scores[order]
+    bars = ax.barh(names, values,
+                   color=[PROTOCOL_COLORS[n] for n in names])
+    ax.bar_label(bars, labels=[f"{v:.1f}" for v in values], fontsize=10,
+                 fontweight="bold", padding=4)
+
+    ax.set_xlabel("Composite score (higher is better)")
+    ax.set_title("Protocol Summary (0.6 x hit rate + 0.4 x latency headroom)")
+    return _save(fig, os.path.join(output_dir, "summary.png"))
+
+
+def generate_markdown_report(output_dir, chart_files):
+    # Hoist the per-protocol dicts/lists into locals once instead of
+    # repeating the dict lookups inside one giant f-string; sections are
+    # streamed to the file as they are formatted.
+    lch, lko = LATENCY["Chord"], LATENCY["Koorde"]
+    hsh, hch, hko = (HIT_RATES["Simple Hash"], HIT_RATES["Chord"],
+                     HIT_RATES["Koorde"])
+    # Plain sum/len: np.mean on a 3-element Python list allocates a
+    # temporary ndarray and goes through ufunc dispatch for no benefit.
+    avg_simple = sum(hsh) / len(hsh)
+    avg_chord = sum(hch) / len(hch)
+    avg_koorde = sum(hko) / len(hko)
+
+    report_path = os.path.join(output_dir, "report.md")
+    with open(report_path, "w") as f:
+        f.write("# KoordeDHT Web Cache - Benchmark Report\n\n")
+
+        f.write(f"""## Experiment 1: Latency Scaling
+
+![Latency]({os.path.basename(chart_files["latency"])})
+
+At 32 nodes Chord held {lch["avg"]:.1f} ms average
+(P99 {lch["p99"]} ms) while Koorde rose to
+{lko["avg"]:.1f} ms average (P99 {lko["p99"]} ms).
+Chord's finger-table routing stays flat across the tested range; Koorde
+pays higher per-hop constants that mask its asymptotic advantage at this
+scale.
+
+""")
+
+        f.write(f"""## Experiment 2: Hit Rate Under Churn
+
+![Hit rate]({os.path.basename(chart_files["hit_rate"])})
+
+| Protocol | Phase 1 | Phase 2 | Phase 3 | Average |
+|----------|---------|---------|---------|---------|
+| Simple Hash | {hsh[0]:.1f}% | {hsh[1]:.1f}% | {hsh[2]:.1f}% | {avg_simple:.1f}% |
+| Chord | {hch[0]:.1f}% | {hch[1]:.1f}% | {hch[2]:.1f}% | {avg_chord:.1f}% |
+| Koorde | {hko[0]:.1f}% | {hko[1]:.1f}% | {hko[2]:.1f}% | {avg_koorde:.1f}% |
+
+Consistent hashing (Chord, Koorde) preserved roughly 75% of cached keys
+across the 4 -> 3 -> 4 churn; the static modulo strategy invalidated the
+same fraction instead.
+
+""")
+
+        f.write(f"""## Experiment 3: Throughput and Failures
+
+![Failure rate]({os.path.basename(chart_files["failures"])})
+
+Chord saturated around {max(THROUGHPUT["Chord"])} RPS; Koorde peaked near
+{max(THROUGHPUT["Koorde"])} RPS and declined at 4000 users with a
+{FAILURE_RATES["Koorde"][-1]:.1f}% failure rate.
+
+""")
+
+        f.write(f"""## Summary
+
+![Summary]({os.path.basename(chart_files["summary"])})
+""")
+    return report_path
+
+
+def main():
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "results"
+    os.makedirs(output_dir, exist_ok=True)
+    setup_style()
+
+    # The four charts are independent CPU-bound Agg renders, so fan them
+    # out across processes; each worker keeps its own cached Figure
+    # (module globals are per-process) and applies the style once via the
+    # initializer.
+    jobs = {
+        "hit_rate": create_hit_rate_chart,
+        "failures": create_failures_chart,
+        "latency": create_latency_chart,
+        "summary": create_summary_chart,
+    }
+    with ProcessPoolExecutor(max_workers=4, initializer=setup_style) as ex:
+        futures = {name: ex.submit(fn, output_dir)
+                   for name, fn in jobs.items()}
+        chart_files = {name: f.result() for name, f in futures.items()}
+    report = generate_markdown_report(output_dir, chart_files)
+
+    for path in list(chart_files.values()) + [report]:
+        print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Locust throughput benchmark for the KoordeDHT web cache.
+
+Drives a Zipf-distributed GET workload against the /cache endpoint of a
+running cluster (local docker-compose via the nginx load balancer, or an
+EKS service) and tracks cache hit/miss/error counters on top of Locust's
+own request statistics.
+
+Usage:
+    locust -f scripts/locust-throughput.py --host http://localhost:9000 \
+        --users 50 --spawn-rate 10 --run-time 5m --headless
+
+Environment:
+    URL_POOL_SIZE   number of distinct origin URLs to request (default 1000)
+    ZIPF_ALPHA      Zipf exponent for URL popularity (default 1.2)
+    ORIGIN_BASE     base URL of the origin server the cache fetches from
+"""
+
+import os
+import time
+from urllib.parse import quote
+
+import numpy as np
+from locust import between, events, task
+from locust.contrib.fasthttp import FastHttpUser
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj)
+
+URL_POOL_SIZE = int(os.environ.get("URL_POOL_SIZE", "1000"))
+ZIPF_ALPHA = float(os.environ.get("ZIPF_ALPHA", "1.2"))
+ORIGIN_BASE = os.environ.get("ORIGIN_BASE", "http://origin-nginx")
+
+
+def zipf_weights(n, alpha=ZIPF_ALPHA):
+    """Return normalized Zipf weights for ranks 1..n as a float64 ndarray."""
+    w = np.arange(1, n + 1, dtype=np.float64) ** -alpha
+    w /= w.sum()
+    return w
+
+
+def _build_alias(weights):
+    """Build Walker alias tables for O(1) weighted sampling.
+
+    Returns (prob, alias) where prob is float64 and alias is int64, both of
+    length n. A draw is: pick i uniformly, return i with probability prob[i],
+    otherwise alias[i]. This avoids random.choices rebuilding the cumulative
+    weight list on every call.
+    """
+    w = np.asarray(weights, dtype=np.float64)
+    n = len(w)
+    prob = np.zeros(n, dtype=np.float64)
+    alias = np.zeros(n, dtype=np.int64)
+
+    scaled = w * n / w.sum()
+    small = [i for i in range(n) if scaled[i] < 1.0]
+    large = [i for i in range(n) if scaled[i] >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] = scaled[l] + scaled[s] - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+
+    # Leftovers are 1.0 up to floating point error.
+    for i in large:
+        prob[i] = 1.0
+    for i in small:
+        prob[i] = 1.0
+
+    return prob, alias
+
+
+def _cached_tables(n, alpha):
+    """Load or build the Zipf weight and alias tables for (n, alpha).
+
+    Every Locust worker process recomputes identical arrays at startup,
+    which adds up when many workers launch at once. The tables are
+    memoized to /tmp keyed by (n, alpha); mmap_mode='r' turns the warm
+    start into a mapped read and lets workers on the same host share the
+    pages.
+    """
+    tag = f"{n}_{alpha:.3f}"
+    paths = [f"/tmp/zipf_{kind}_{tag}.npy"
+             for kind in ("weights", "prob", "alias")]
+    if all(os.path.exists(p) for p in paths):
+        try:
+            return tuple(np.load(p, mmap_mode="r") for p in paths)
+        except (OSError, ValueError):
+            # Another worker may have raced us mid-write before the
+            # atomic rename below existed; recompute rather than crash.
+            pass
+    w = zipf_weights(n, alpha)
+    prob, alias = _build_alias(w)
+    for path, arr in zip(paths, (w, prob, alias)):
+        # Write to a private temp name, then rename: os.replace is
+        # atomic on POSIX, so concurrently launching workers see either
+        # a complete file or none — never a truncated one. The .npy
+        # suffix keeps np.save from appending its own.
+        tmp = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp, arr)
+        os.replace(tmp, path)
+    return w, prob, alias
+
+
+# Tuples rather than lists: the pools are shared read-only across all
+# greenlets, and tuple indexing skips the mutability bookkeeping list
+# reads carry. The sampling tables stay as ndarrays (contiguous, no
+# per-element PyObject).
+url_pool = tuple(f"{ORIGIN_BASE}/item-{i}.html" for i in range(URL_POOL_SIZE))
+WEIGHTS, PROB, ALIAS = _cached_tables(URL_POOL_SIZE, ZIPF_ALPHA)
+_POOL_N = len(url_pool)
+
+# Request paths are fixed for the lifetime of the test, so build them (and
+# pay the URL-escaping cost) once at import instead of formatting an f-string
+# per request on the RPS-critical path.
+CACHE_URLS = tuple(f"/cache?url={quote(u, safe='')}" for u in url_pool)
+
+
+# Outcome indices into the shared counter array. A single contiguous int64
+# array replaces the old Stats object with four scattered Python ints: users
+# accumulate into per-greenlet locals and flush in batches (see
+# ThroughputUser._bump), so the shared array is touched once per
+# _FLUSH_EVERY requests instead of once per request.
+REQ, HIT, MISS, ERR = 0, 1, 2, 3
+COUNTS = np.zeros(4, dtype=np.int64)
+_FLUSH_EVERY = 512
+
+
+class Stats:
+    """Read-side view over the shared COUNTS array."""
+
+    def __init__(self):
+        self.start_time = time.time()
+
+    @property
+    def requests(self):
+        return int(COUNTS[REQ])
+
+    @property
+    def hits(self):
+        return int(COUNTS[HIT])
+
+    @property
+    def misses(self):
+        return int(COUNTS[MISS])
+
+    @property
+    def errors(self):
+        return int(COUNTS[ERR])
+
+    # Plain methods, not properties: these do a time.time() call and
+    # divisions, and are only meaningful once per run. Mid-run RPS should
+    # come from Locust's own stats, not from polling these.
+    def compute_rps(self):
+        elapsed = time.time() - self.start_time
+        return int(COUNTS[REQ]) / elapsed if elapsed > 0 else 0.0
+
+    def compute_hit_rate(self):
+        completed = int(COUNTS[HIT]) + int(COUNTS[MISS])
+        return 100.0 * int(COUNTS[HIT]) / completed if completed > 0 else 0.0
+
+
+stats = Stats()
+
+
+class ThroughputUser(FastHttpUser):
+    # FastHttpUser (geventhttpclient) keeps connections persistent and has a
+    # much thinner request path than the python-requests based HttpUser,
+    # which caps out around ~240 RPS/core. Locust already applies
+    # gevent.monkey.patch_all(), so no extra patching is needed here.
+    wait_time = between(0, 0)
+    network_timeout = 10.0
+    connection_timeout = 5.0
+
+    def on_start(self):
+        self._local = [0, 0, 0, 0]
+        self._run = self._specialize()
+
+    def on_stop(self):
+        self._flush()
+
+    def _bump(self, idx):
+        local = self._local
+        local[REQ] += 1
+        local[idx] += 1
+        if local[REQ] >= _FLUSH_EVERY:
+            self._flush()
+
+    def _flush(self):
+        COUNTS[:] += self._local
+        self._local = [0, 0, 0, 0]
+
+    def _specialize(self):
+        """Build the specialized per-user request function.
+
+        Partially evaluates cache_request against the state frozen at
+        startup: the alias tables, URL pool, bound client.get and the
+        counter-flush method all become closure locals, so the hot loop
+        runs on LOAD_FAST instead of re-resolving globals and attributes
+        on every call.
+        """
+        client_get = self.client.get
+        rng = np.random.default_rng()
+        prob, alias, urls = PROB, ALIAS, CACHE_URLS
+        n = _POOL_N
+        bump = self._bump
+
+        # Pre-draw alias-resolved indices in batches so the NumPy C
+        # boundary is crossed three times per _BATCH draws instead of
+        # twice per request.
+        _BATCH = 1024
+        buf = np.empty(0, dtype=np.int64)
+        pos = 0
+
+        def run():
+            nonlocal buf, pos
+            if pos >= len(buf):
+                i = rng.integers(0, n, _BATCH)
+                r = rng.random(_BATCH)
+                buf = np.where(r < prob[i], i, alias[i])
+                pos = 0
+            idx = int(buf[pos])
+            pos += 1
+            with client_get(
+                urls[idx], catch_response=True, name="/cache"
+            ) as response:
+                if response.status_code == 200:
+                    # The cache server always emits uppercase
+                    # "HIT-*"/"MISS-*" (see internal/node/server/http.go),
+                    # so match the raw header instead of allocating an
+                    # uppercased copy per request.
+                    cache_status = response.headers.get("X-Cache", "")
+                    if cache_status.startswith("HIT"):
+                        bump(HIT)
+                    else:
+                        bump(MISS)
+                    response.success()
+                else:
+                    bump(ERR)
+                    response.failure(f"status {response.status_code}")
+
+        return run
+
+    @task
+    def cache_request(self):
+        self._run()
+
+
+@events.test_stop.add_listener
+def on_stop(environment, **kwargs):
+    result = {
+        "requests": stats.requests,
+        "hits": stats.hits,
+        "misses": stats.misses,
+        "errors": stats.errors,
+        "hit_rate_pct": round(stats.compute_hit_rate(), 2),
+        "rps": round(stats.compute_rps(), 2),
+    }
+    print("=" * 50)
+    print("Cache throughput summary")
+    for key, value in result.items():
+        print(f"  {key:>12}: {value}")
+    print("=" * 50)
+
+    # Machine-readable copy for CI: set LOCUST_RESULT_JSON to a path and
+    # downstream tooling can ingest the run without scraping stdout.
+    result_path = os.environ.get("LOCUST_RESULT_JSON")
+    if result_path:
+        with open(result_path, "w") as f:
+            f.write(_dumps(result))
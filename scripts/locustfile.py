@@ -0,0 +1,135 @@
+"""Locust workload for the KoordeDHT web cache latency experiments.
+
+Simulates clients requesting a fixed pool of httpbin-backed URLs through
+the /cache endpoint with Zipf-skewed popularity (hot keys) plus a smaller
+uniform-random component, mirroring the workload described in the README
+latency experiments.
+
+Usage:
+    locust -f scripts/locustfile.py --host http://localhost:9000 \
+        --users 50 --spawn-rate 10 --run-time 10m --headless \
+        --csv results/local
+"""
+
+import random
+from bisect import bisect_left
+from functools import lru_cache
+from urllib.parse import quote
+
+import numpy as np
+from locust import HttpUser, between, events, task
+
+URL_POOL_SIZE = 300
+
+HTTPBIN_ENDPOINTS = [
+    "/html",
+    "/json",
+    "/xml",
+    "/robots.txt",
+    "/uuid",
+]
+
+ZIPF_ALPHA = 1.2
+
+
+@lru_cache(maxsize=1)
+def _get_cache_paths():
+    """Build the escaped /cache request paths, once per process.
+
+    Lazy rather than import-time: with ``--processes N`` every Locust
+    process imports this module, but only the ones that actually spawn
+    users pay for the build — the master and any idle worker skip it.
+    The trade-off is that each worker builds its own private copy after
+    the fork (import-time construction in the parent would have shared
+    the pages copy-on-write instead). Tuples: the pool is shared
+    read-only across all users in a process.
+    """
+    pool = (
+        f"https://httpbin.org"
+        f"{HTTPBIN_ENDPOINTS[i % len(HTTPBIN_ENDPOINTS)]}?id={i}"
+        for i in range(URL_POOL_SIZE)
+    )
+    return tuple(f"/cache?url={quote(u, safe='')}" for u in pool)
+
+
+@lru_cache(maxsize=1)
+def _get_zipf_cdf():
+    """Cumulative Zipf distribution over URL ranks, once per process.
+
+    Returned as a plain list: for one scalar draw per request, bisect on
+    a list beats np.searchsorted, which pays array-dispatch overhead per
+    call.
+    """
+    w = np.arange(1, URL_POOL_SIZE + 1, dtype=np.float64) ** -ZIPF_ALPHA
+    w /= w.sum()
+    return np.cumsum(w).tolist()
+
+# Short module-level aliases so the per-request draw compiles to LOAD_GLOBAL
+# of the bound functions directly instead of an attribute walk through the
+# random/bisect modules; these run once per HTTP request in the greenlet
+# loop, where every few hundred nanoseconds shows up at high user counts.
+_bl = bisect_left
+_r = random.random
+_N = URL_POOL_SIZE
+
+class _Stats:
+    """Rough latency bookkeeping across all users, reported at test stop.
+
+    __slots__ keeps the two counters in fixed slots instead of a per-
+    instance dict, and a single object attribute update avoids the
+    global-declaration rebinding the old module globals needed.
+    """
+
+    __slots__ = ("lat", "n")
+
+    def __init__(self):
+        self.lat = 0.0
+        self.n = 0
+
+
+_stats = _Stats()
+
+
+class KoordeCacheUser(HttpUser):
+    wait_time = between(0.1, 0.5)
+
+    def on_start(self):
+        # Bind the shared pool/CDF to the instance so the tasks read
+        # them via LOAD_FAST on self instead of a global lookup.
+        self._paths = _get_cache_paths()
+        self._cdf = _get_zipf_cdf()
+
+    def _select_path_zipf(self):
+        return self._paths[_bl(self._cdf, _r())]
+
+    @task(3)
+    def cache_request(self):
+        self.client.get(self._select_path_zipf(), name="/cache [Zipf]")
+
+    @task(1)
+    def cache_request_random(self):
+        # int(_r() * n) instead of random.choice: skips choice()'s
+        # _randbelow modulo-rejection path for a plain scaled draw.
+        self.client.get(self._paths[int(_r() * _N)], name="/cache [random]")
+
+    @task(1)
+    def health_check(self):
+        self.client.get("/health", name="/health")
+
+
+@events.request.add_listener
+def on_request(request_type, name, response_time, response_length, response,
+               context, exception, **kwargs):
+    # Bail out before touching any state; this listener runs once per
+    # request for every user.
+    if exception is not None:
+        return
+    _stats.lat += response_time
+    _stats.n += 1
+
+
+@events.test_stop.add_listener
+def on_test_stop(environment, **kwargs):
+    if _stats.n > 0:
+        print(f"Mean latency over {_stats.n} requests: "
+              f"{_stats.lat / _stats.n:.1f} ms")
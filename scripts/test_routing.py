@@ -0,0 +1,345 @@
+"""Verify that /cache requests land on the DHT node that owns the key.
+
+Recomputes the SHA-1 identifier for a set of test URLs the same way the
+Go nodes do (internal/domain/identifier.go: first BYTE_LEN digest bytes,
+high bits of the first byte masked down to idBits), predicts the
+responsible node among the hashed koorde-node-<i> identifiers, and
+checks the X-Node-ID header returned through the load balancer on
+localhost:9000.
+
+Usage:
+    python scripts/test_routing.py [config.json] [--verbose]
+
+The optional JSON config may override num_nodes and id_bits. A
+structured JSON report goes to stdout; --verbose adds the per-URL
+human-readable blocks on stderr.
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import socket
+import sys
+import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote
+
+import numpy as np
+import requests
+
+DEFAULT_CONFIG = {
+    "num_nodes": 8,
+    "id_bits": 64,
+}
+
+# CPython's hashlib.sha1 delegates to the linked OpenSSL, whose assembly
+# picks the SHA-NI instruction path on CPUs that have it (check with
+# `openssl speed sha1`), so the hashing below already runs on the fastest
+# available SHA-1 implementation. Bound once so the batch loop does a
+# plain fast-local call instead of a module attribute walk per string.
+_sha1 = hashlib.sha1
+
+TEST_URLS = [
+    "https://httpbin.org/html",
+    "https://httpbin.org/json",
+    "https://httpbin.org/xml",
+    "https://httpbin.org/uuid",
+    "https://example.com/",
+    "https://example.org/",
+    "https://example.net/",
+    "https://www.wikipedia.org/",
+]
+
+
+@lru_cache(maxsize=None)
+def _read_config(path=None):
+    """Read and parse the config file once per distinct path."""
+    config = dict(DEFAULT_CONFIG)
+    if path is not None:
+        with open(path) as f:
+            config.update(json.load(f))
+    config["byte_len"] = (config["id_bits"] + 7) // 8
+    return config
+
+
+def load_config(path=None):
+    """Load the config, refreshing the derived module constants.
+
+    Only the file read is memoized; _configure runs unconditionally so
+    the module-level mask/width constants always match the config this
+    call returns, even when alternating between configs in one process.
+    """
+    config = _read_config(path)
+    _configure(config["id_bits"])
+    return config
+
+
+def _configure(id_bits):
+    """Precompute the id_bits-derived constants the hash helpers use.
+
+    Hoisted to module globals so the per-call arithmetic (divisions,
+    shift, conditional) runs once per config instead of once per hashed
+    string.
+    """
+    global _BYTE_LEN, _EXTRA_BITS, _FIRST_BYTE_MASK, _FULL_MASK, _HEX_WIDTH
+    _BYTE_LEN = (id_bits + 7) // 8
+    _EXTRA_BITS = _BYTE_LEN * 8 - id_bits
+    _FIRST_BYTE_MASK = np.uint8(0xFF >> _EXTRA_BITS)
+    _FULL_MASK = (1 << id_bits) - 1
+    _HEX_WIDTH = _BYTE_LEN * 2
+
+
+_configure(DEFAULT_CONFIG["id_bits"])
+
+
+def ids_from_strings(strings):
+    """SHA-1 identifiers for a batch of strings as an (N, BYTE_LEN) array.
+
+    One contiguous uint8 row per ID instead of per-string bytearray and
+    hex allocations; the id_bits masking then becomes a single vectorized
+    AND over the whole first column.
+
+    The per-digest work itself stays in hashlib: OpenSSL's hand-written
+    (and SHA-NI-aware) compression is faster than anything a JIT'd
+    Python reimplementation reaches, so scaling to large node sweeps is
+    about keeping the Python loop thin, not replacing the hash. The
+    output array is preallocated and filled row by row, avoiding the
+    intermediate list plus copy that np.stack would do for large N.
+    """
+    ids = np.empty((len(strings), _BYTE_LEN), dtype=np.uint8)
+    for i, s in enumerate(strings):
+        ids[i] = np.frombuffer(_sha1(s.encode("utf-8")).digest(),
+                               dtype=np.uint8)[:_BYTE_LEN]
+    ids[:, 0] &= _FIRST_BYTE_MASK
+    return ids
+
+
+def ids_to_hex(ids):
+    """Hex strings for an (N, BYTE_LEN) ID array, display/compare only."""
+    h = ids.tobytes().hex()
+    return [h[i:i + _HEX_WIDTH] for i in range(0, len(h), _HEX_WIDTH)]
+
+
+# SHA-1 state after absorbing the shared node-name prefix; copy() clones
+# it cheaply, so each node pays only for hashing its index suffix.
+_NODE_PREFIX_H = _sha1(b"koorde-node-")
+
+
+def _node_id(i):
+    """ID for koorde-node-<i>, resuming the shared prefix hash state."""
+    h = _NODE_PREFIX_H.copy()
+    h.update(str(i).encode("utf-8"))
+    return int.from_bytes(h.digest()[:_BYTE_LEN], "big") & _FULL_MASK
+
+
+def get_node_ids(config):
+    """Hash every node name the way the nodes derive their own IDs.
+
+    Returns a sorted list of ints. Integer sort keys are a single PyLong
+    comparison each and, unlike sorting hex strings, stay correct no
+    matter how the display width is padded.
+    """
+    ids = [_node_id(i) for i in range(config["num_nodes"])]
+    ids.sort()
+    return ids
+
+
+def get_responsible_node(key_int, node_ints):
+    """Successor node index on the ring for one key.
+
+    A C-level binary search over the sorted int ring; the modulo handles
+    the wrap-around past the highest node ID. O(log N) per key with no
+    hex parsing, however large the ring grows.
+    """
+    return bisect_left(node_ints, key_int) % len(node_ints)
+
+
+# One Session per worker thread: keep-alive reuses the TCP connection to
+# the load balancer instead of a fresh handshake per request, and
+# per-thread sessions avoid contending on one shared urllib3 pool lock.
+_tls = threading.local()
+
+_CACHE_PREFIX = "http://localhost:9000/cache?url="
+
+
+def _make_session():
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=16, max_retries=0))
+    return session
+
+
+def _get_session():
+    session = getattr(_tls, "session", None)
+    if session is None:
+        session = _tls.session = _make_session()
+    return session
+
+
+def _warmup(_):
+    # Best-effort: creates this worker thread's session and pays
+    # getaddrinfo plus the TCP handshake before the measured batch,
+    # while also nudging any cold start on the balancer side.
+    try:
+        _get_session().head("http://localhost:9000/", timeout=1.0)
+    except requests.RequestException:
+        pass
+
+
+def _fetch(url):
+    session = _get_session()
+    try:
+        # (connect, read) split: fail fast when the load balancer is
+        # down instead of burning the full read timeout on connect.
+        # quote() keeps the key exact even for URLs carrying their own
+        # query string; the Go side unescapes it (see http.go).
+        return session.get(_CACHE_PREFIX + quote(url, safe=""),
+                           timeout=(1.0, 5.0))
+    except requests.RequestException as exc:
+        return exc
+
+
+def test_routing(config, verbose=False):
+    """Run the verification and return a machine-readable report dict.
+
+    The human-readable per-URL blocks are only rendered (to stderr) when
+    verbose is set; the caller decides what to do with the structured
+    report, so CI can aggregate runs without scraping free-form text.
+    """
+    node_ints = get_node_ids(config)
+    node_ids = [f"{x:0{_HEX_WIDTH}x}" for x in node_ints]
+    # All URL keys hashed in one batch, then resolved to successors with
+    # one binary search each.
+    key_arr = ids_from_strings(TEST_URLS)
+    key_hexes = ids_to_hex(key_arr)
+    key_ints = [int.from_bytes(row.tobytes(), "big") for row in key_arr]
+    expected_idx = [get_responsible_node(k, node_ints) for k in key_ints]
+    # Buffer each verbose block and hand it over in one write: a print
+    # per line means a lock acquire, encode and write syscall each, and
+    # grouped flushes keep blocks atomic in aggregated CI logs.
+    buf = io.StringIO()
+    w = buf.write
+    if verbose:
+        w(f"Ring of {len(node_ids)} nodes "
+          f"({config['id_bits']}-bit IDs):\n")
+        for node_hex in node_ids:
+            w(f"  {node_hex}\n")
+        sys.stderr.write(buf.getvalue())
+        buf.seek(0)
+        buf.truncate(0)
+
+    # The fetches are independent and I/O-bound, so overlap them: total
+    # wall time is ~one RTT (plus the slowest origin fetch) instead of
+    # the sum over all URLs. executor.map preserves input order, so the
+    # report below stays deterministic. The warm-up round goes through
+    # the same per-thread sessions the fetches use, so pool threads open
+    # their keep-alive connections before the measured batch (thread
+    # scheduling makes this best-effort: a fast thread may absorb more
+    # than one warm-up).
+    max_workers = min(16, len(TEST_URLS))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_warmup, range(max_workers)))
+        responses = list(executor.map(_fetch, TEST_URLS))
+
+    # The header is parsed once with int(hex, 16) and matched against
+    # the expected ID numerically; hex strings only appear in output.
+    results = []
+    matched = 0
+    checked = 0
+    for url, key_hex, idx, resp in zip(TEST_URLS, key_hexes,
+                                       expected_idx, responses):
+        entry = {
+            "url": url,
+            "key": key_hex,
+            "expected": node_ids[idx],
+            "actual": None,
+            "status": None,
+            "cache": None,
+            "match": False,
+            "error": None,
+        }
+        if verbose:
+            w(f"\n{url}\n")
+            w(f"  key      {key_hex}\n")
+            w(f"  expected {node_ids[idx]}\n")
+        if isinstance(resp, Exception):
+            entry["error"] = str(resp)
+            if verbose:
+                w(f"  request failed: {resp}\n")
+        else:
+            entry["status"] = resp.status_code
+            entry["cache"] = resp.headers.get("X-Cache")
+            # The server contract (domain.ID.ToHexString) is "0x" plus
+            # exactly _HEX_WIDTH lowercase hex digits; enforcing it here
+            # turns any format or width drift into an explicit failure
+            # instead of being papered over by normalization.
+            hdr = resp.headers.get("X-Node-ID", "")
+            actual = None
+            if hdr.startswith("0x") and len(hdr) == 2 + _HEX_WIDTH:
+                try:
+                    actual = int(hdr[2:], 16)
+                except ValueError:
+                    pass
+            if actual is None:
+                entry["error"] = f"X-Node-ID violates contract: {hdr!r}"
+                if verbose:
+                    w(f"  X-Node-ID violates the 0x+{_HEX_WIDTH}-digit "
+                      f"contract: {hdr!r}\n")
+            else:
+                entry["actual"] = f"{actual:0{_HEX_WIDTH}x}"
+                checked += 1
+                if actual == node_ints[idx]:
+                    matched += 1
+                    entry["match"] = True
+                if verbose:
+                    w(f"  actual   {entry['actual']} "
+                      f"(X-Cache: {entry['cache'] or '?'})\n")
+                    w("  OK\n" if entry["match"] else "  MISMATCH\n")
+        results.append(entry)
+        if verbose:
+            sys.stderr.write(buf.getvalue())
+            buf.seek(0)
+            buf.truncate(0)
+
+    if verbose:
+        sys.stderr.write(
+            f"\n{matched}/{checked} routed to the predicted node "
+            f"({len(TEST_URLS) - checked} request errors)\n")
+    return {
+        "nodes": node_ids,
+        "id_bits": config["id_bits"],
+        "results": results,
+        "summary": {
+            "matched": matched,
+            "checked": checked,
+            "total": len(TEST_URLS),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("config", nargs="?", default=None,
+                        help="JSON config overriding num_nodes/id_bits")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="also print the per-URL report to stderr")
+    args = parser.parse_args()
+
+    # Bound getaddrinfo and any socket without an explicit timeout.
+    socket.setdefaulttimeout(5.0)
+    config = load_config(args.config)
+    report = test_routing(config, verbose=args.verbose)
+    # One structured document on stdout; downstream tooling aggregates
+    # runs without scraping the free-form text.
+    json.dump(report, sys.stdout)
+    sys.stdout.write("\n")
+    summary = report["summary"]
+    ok = summary["matched"] == summary["total"]
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()